@@ -7,113 +7,908 @@ subdirectories while preserving the original directory structure within each yea
 """
 
 import argparse
+import asyncio
+import bisect
+import ctypes
+import errno
+import functools
 import os
+import platform
+import queue
+import re
 import shutil
+import stat
+import struct
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+from typing import Optional, Union
 
+# Local-time timestamps of 1 January for each year, so a file's year can be
+# found with a binary search. Starts at 1971 since the start of 1970 is a
+# negative timestamp east of UTC, which Windows cannot convert.
+FIRST_YEAR = 1971
+YEAR_STARTS = [datetime(year, 1, 1).timestamp() for year in range(FIRST_YEAR, 2101)]
 
-def move_files(source_dir: str, copy: bool, dry_run: bool, full_path: bool) -> tuple[int, int]:
+# Directory names that look like a year
+YEAR_RE = re.compile(r'[12][0-9]{3}')
+
+# Number of threads listing directories in parallel
+SCAN_WORKERS = 8
+
+# Number of output lines buffered before writing them out
+OUTPUT_BATCH_SIZE = 1000
+
+# statx(2) constants, see linux/fcntl.h and linux/stat.h
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_MTIME = 0x40
+STATX_BTIME = 0x800
+
+# statx(2) syscall numbers by machine and process pointer size, for glibc
+# older than 2.28 which has no statx wrapper. The pointer size tells a 32-bit
+# userland apart from the 64-bit kernel it runs on.
+SYS_STATX_NUMBERS = {
+    ('x86_64', 64): 332,
+    ('x86_64', 32): 383,
+    ('i386', 32): 383,
+    ('i686', 32): 383,
+    ('aarch64', 64): 291,
+    ('aarch64', 32): 397,
+    ('armv6l', 32): 397,
+    ('armv7l', 32): 397,
+    ('armv8l', 32): 397,
+    ('ppc64', 64): 383,
+    ('ppc64le', 64): 383,
+    ('s390x', 64): 379,
+    ('riscv64', 64): 291,
+}
+
+class StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('__reserved', ctypes.c_int32),
+    ]
+
+
+class Statx(ctypes.Structure):
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('__spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', StatxTimestamp),
+        ('stx_btime', StatxTimestamp),
+        ('stx_ctime', StatxTimestamp),
+        ('stx_mtime', StatxTimestamp),
+        # The kernel always fills the full 256-byte structure
+        ('__spare', ctypes.c_uint8 * 128),
+    ]
+
+
+# Errors meaning a zero-copy primitive is unsupported for this pair of files
+ZERO_COPY_FALLBACK_ERRORS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTSOCK,
+    errno.EBADF,
+}
+
+# Buffer size of the userspace copy used when no zero-copy primitive works
+COPY_BUFSIZE = 1024 * 1024
+
+# getattrlistbulk(2) constants, see sys/attr.h and sys/vnode.h
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_CRTIME = 0x00000200
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+VREG = 1
+VDIR = 2
+VLNK = 5
+
+# Size of the buffer getattrlistbulk fills with directory entries
+BULK_BUFFER_SIZE = 64 * 1024
+
+
+class AttrList(ctypes.Structure):
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+class BulkEntry:
+    """
+    Directory entry read with getattrlistbulk, standing in for os.DirEntry.
+
+    Carries the creation time returned with the listing, so no stat call is
+    needed to classify the file.
+    """
+
+    __slots__ = ('name', 'path', 'birthtime')
+
+    def __init__(self, name: str, path: str, birthtime: Optional[float]):
+        self.name = name
+        self.path = path
+        self.birthtime = birthtime
+
+    def stat(self) -> os.stat_result:
+        return os.stat(self.path)
+
+
+if sys.platform.startswith('linux') or sys.platform == 'darwin':
+    libc = ctypes.CDLL(None, use_errno=True)
+else:
+    libc = None
+
+# Function calling statx(2), or None where it is not available
+STATX = None
+
+if sys.platform.startswith('linux'):
+    if hasattr(libc, 'statx'):
+        STATX = libc.statx
+        STATX.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(Statx)]
+        STATX.restype = ctypes.c_int
+    else:
+        sys_statx = SYS_STATX_NUMBERS.get((platform.machine(), ctypes.sizeof(ctypes.c_void_p) * 8))
+        if sys_statx is not None:
+            libc.syscall.restype = ctypes.c_long
+            STATX = functools.partial(libc.syscall, ctypes.c_long(sys_statx))
+
+# getattrlistbulk is available from macOS 10.10
+BULK_LISTING = sys.platform == 'darwin' and hasattr(libc, 'getattrlistbulk')
+
+if BULK_LISTING:
+    libc.getattrlistbulk.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64]
+    libc.getattrlistbulk.restype = ctypes.c_int
+
+
+def move_files(source_dir: str, copy: bool, dry_run: bool, full_path: bool, concurrency: Optional[int] = None) -> tuple[int, int]:
     """
     Move files to their respective year-based directories.
 
     Args:
         dry_run: If True, only print what would be done without actually moving files
+        concurrency: Number of files moved or copied at the same time
 
     Returns:
         Tuple of (number of files moved, number of errors)
     """
-    source_path = Path(source_dir).resolve()
+    if concurrency is None:
+        concurrency = default_concurrency(copy)
+
+    return asyncio.run(organise_files(source_dir, copy, dry_run, full_path, concurrency))
+
+
+async def organise_files(source_dir: str, copy: bool, dry_run: bool, full_path: bool, concurrency: int) -> tuple[int, int]:
+    """
+    Scan the source directory and dispatch each file's move or copy.
+
+    The blocking file operations run in a thread pool driven from an asyncio
+    event loop, with a semaphore limiting how many are in flight at once.
+
+    Returns:
+        Tuple of (number of files moved, number of errors)
+    """
+    source_path = os.path.realpath(source_dir)
+    source_parent = os.path.dirname(source_path)
+
+    # Length of the parent directory including its trailing separator, so the
+    # path relative to it can be sliced off instead of computed
+    prefix_len = len(os.path.join(source_parent, ''))
+    source_parent_name = os.path.basename(source_parent)
 
     # Process each file
     moved_count = 0
     error_count = 0
-    
-    for root, _, files in os.walk(source_dir):
-        root_path = Path(root)
-                
-        for filename in files:
-            file_path = (root_path / filename).resolve()
+    created_dirs = {source_parent}
+    same_filesystem = None
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = set()
+
+    async def transfer(source: str, destination: str) -> None:
+        nonlocal moved_count, error_count
+
+        try:
+            error = await loop.run_in_executor(executor, transfer_file, source, destination, copy, same_filesystem)
+        finally:
+            semaphore.release()
+
+        # Counts and output are only touched from the event loop, so need no lock
+        if error is None:
+            moved_count += 1
+        else:
+            output.append(error)
+            error_count += 1
+
+    # Messages are written in batches rather than printed one by one
+    output = []
+    action = message_action(copy, dry_run)
+
+    # Stream the files straight from the scan to the workers, so moving starts
+    # as soon as the first file is found
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Scan from the resolved source, so every path found is already
+        # absolute and inside it, with no need to resolve each file
+        scan = DirectoryScan(source_path)
+        try:
+            while True:
+                # Wait for the next directory's files in a thread, so the event
+                # loop keeps starting transfers and releasing finished slots
+                files = await loop.run_in_executor(None, scan.next_batch)
+                if files is None:
+                    break
+
+                for entry in files:
+                    file_path = entry.path
+
+                    try:
+                        # Get creation date
+                        year = str(file_creation_year(entry))
+
+                        # Calculate relative path from parent of the source directory
+                        relative_path = file_path[prefix_len:]
+
+                        # Leave files already inside a directory named after their year,
+                        # e.g. when re-running on an organised tree
+                        if in_year_directory(relative_path, year, source_parent_name):
+                            continue
+
+                        # Build new path: year / source_dir / relative_path
+                        new_file_path = os.path.join(source_parent, year, relative_path)
+
+                        if not dry_run:
+                            # Create the destination directory here rather than in the
+                            # workers, so they never race on mkdir. Most files go to a
+                            # directory already created, so check that before the call.
+                            new_dir = os.path.dirname(new_file_path)
+                            if new_dir not in created_dirs:
+                                make_dirs(new_dir, created_dirs)
+
+                            if same_filesystem is None:
+                                # The year directories live next to the source directory, so unless
+                                # the source is a mount point, files can be moved with a plain rename
+                                same_filesystem = not copy and os.stat(source_path).st_dev == os.stat(source_parent).st_dev
+
+                        output.append(format_message(file_path, new_file_path, relative_path, year, action, full_path))
+
+                        if not dry_run:
+                            # Wait for a free slot, which also lets finished transfers report back
+                            await semaphore.acquire()
+                            task = asyncio.create_task(transfer(file_path, new_file_path))
+                            tasks.add(task)
+                            task.add_done_callback(tasks.discard)
+
+                    except Exception as e:
+                        output.append(f"Error processing {file_path}: {e}\n")
+                        error_count += 1
+
+                    if len(output) >= OUTPUT_BATCH_SIZE:
+                        flush_output(output)
+        finally:
+            # The scan may still be running in another thread, e.g. when
+            # interrupted, so stop it rather than waiting for it
+            scan.cancel()
 
             try:
-                # Get creation date
-                year = file_creation_date(file_path).year
-                
-                # Calculate relative path from parent of the source directory
-                relative_path = file_path.relative_to(source_path.parent)
-                
-                # Build new path: year / source_dir / relative_path
-                new_file_path = source_path.parent / str(year) / relative_path
-                
-                if not dry_run:
-                    # Create destination directory if it doesn't exist
-                    new_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    print_message(file_path, new_file_path, copy, full_path, source_path, dry_run)
-
-                    if copy:
-                        # Copy the file
-                        shutil.copy2(str(file_path), str(new_file_path))
-                    else:
-                        # Move the file
-                        shutil.move(str(file_path), str(new_file_path))
-                    
-                    moved_count += 1
-                else:
-                    print_message(file_path, new_file_path, copy, full_path, source_path, dry_run)
+                # Let the transfers already dispatched finish, so the outcome
+                # of each is logged even when the run is interrupted
+                await asyncio.gather(*tasks)
+            finally:
+                # The output is the only record of which files were moved, so
+                # always write out what is buffered
+                flush_output(output)
 
-            except Exception as e:
-                print(f"Error processing {file_path}: {e}")
-                error_count += 1
+        error_count += scan.error_count
 
     return moved_count, error_count
 
 
-def file_creation_date(file_path: str) -> datetime:
+def in_year_directory(relative_path: str, year: str, source_parent_name: str) -> bool:
+    """
+    Check whether a file already sits inside a directory named after its year.
+
+    Args:
+        relative_path: Path of the file relative to the parent of the source directory
+        year: Creation year of the file
+        source_parent_name: Name of the parent of the source directory
+
+    Returns:
+        True if the parent of the source directory, or any directory along the
+        relative path, is named after the year
+    """
+    if source_parent_name == year:
+        return True
+
+    return year in year_directories(os.path.dirname(relative_path))
+
+
+@functools.lru_cache(maxsize=4096)
+def year_directories(relative_dir: str) -> frozenset:
+    """
+    Get the names along a directory path that look like years.
+
+    Cached, since the scan yields all files of a directory one after another.
+
+    Args:
+        relative_dir: Directory path relative to the parent of the source directory
+
+    Returns:
+        Set of the year-like directory names
+    """
+    return frozenset(name for name in relative_dir.split(os.sep) if len(name) == 4 and YEAR_RE.fullmatch(name))
+
+
+def make_dirs(directory: str, created_dirs: set) -> None:
+    """
+    Create a directory and any missing parents, skipping ones already created.
+
+    Only directories not yet in created_dirs are created, parents first, with
+    a single mkdir each. Unlike os.makedirs, no stat or mkdir calls are made
+    for parents that are already known to exist.
+
+    Args:
+        directory: Directory to create
+        created_dirs: Directories known to exist, updated with the new ones
+    """
+    new_dirs = []
+    while directory not in created_dirs:
+        new_dirs.append(directory)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            # Reached the filesystem root
+            break
+        directory = parent
+
+    for directory in reversed(new_dirs):
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+        created_dirs.add(directory)
+
+
+def transfer_file(source: str, destination: str, copy: bool, same_filesystem: bool) -> Optional[str]:
+    """
+    Move or copy a single file.
+
+    Args:
+        source: Path of the file to move or copy
+        destination: Path the file is moved or copied to
+        copy: If True, copy the file instead of moving it
+        same_filesystem: If True, the destination is known to be on the same filesystem
+
+    Returns:
+        None if the file was transferred, otherwise the error message to output
+    """
+    try:
+        if copy:
+            # Copy the file
+            fast_copy(source, destination)
+        else:
+            # Move the file
+            move_file(source, destination, same_filesystem)
+    except Exception as e:
+        return f"Error processing {source}: {e}\n"
+
+    return None
+
+
+def move_file(source: str, destination: str, same_filesystem: bool) -> None:
+    """
+    Move a file, renaming it directly when it stays on the same filesystem.
+
+    A single rename skips the stat calls shutil.move makes on both paths
+    before trying to rename. Across filesystems a regular file's data is
+    copied with fast_copy, keeping it in the kernel, and the original is
+    removed. Anything else is left to shutil.move.
+
+    Args:
+        source: Path of the file to move
+        destination: Path the file is moved to
+        same_filesystem: If True, try a plain rename first
+    """
+    if same_filesystem:
+        try:
+            os.replace(source, destination)
+            return
+        except OSError as e:
+            # Some directory below the source is another mount
+            if e.errno != errno.EXDEV:
+                raise
+
+    if not stat.S_ISREG(os.lstat(source).st_mode):
+        # Let shutil handle symlinks, recreating the link rather than copying
+        # its target, and reject named pipes and other special files
+        shutil.move(source, destination)
+        return
+
+    fast_copy(source, destination)
+    os.unlink(source)
+
+
+def fast_copy(source: str, destination: str) -> None:
+    """
+    Copy a file and its metadata, keeping the data in the kernel where possible.
+
+    Tries os.copy_file_range first, then os.sendfile, and finally falls back to
+    a buffered userspace copy, continuing from wherever the previous method
+    stopped. Timestamps and permissions are preserved like shutil.copy2.
+
+    Args:
+        source: Path of the file to copy
+        destination: Path of the copy
+
+    Raises:
+        shutil.SpecialFileError: If the source is not a regular file
+    """
+    # Check before opening, as opening a named pipe blocks until it has a writer
+    mode = os.stat(source).st_mode
+    if stat.S_ISFIFO(mode):
+        raise shutil.SpecialFileError(f"`{source}` is a named pipe")
+    if not stat.S_ISREG(mode):
+        raise shutil.SpecialFileError(f"`{source}` is not a regular file")
+
+    with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+        size = os.fstat(infd).st_size
+        copied = 0
+
+        if hasattr(os, 'copy_file_range'):
+            copied = kernel_copy(lambda offset, count: os.copy_file_range(infd, outfd, count, offset, offset), copied, size)
+
+        if copied < size and hasattr(os, 'sendfile'):
+            # sendfile writes at the current position of the destination
+            os.lseek(outfd, copied, os.SEEK_SET)
+            copied = kernel_copy(lambda offset, count: os.sendfile(outfd, infd, offset, count), copied, size)
+
+        if copied < size:
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+
+    shutil.copystat(source, destination)
+
+
+def kernel_copy(copy_chunk, copied: int, size: int) -> int:
+    """
+    Repeatedly call a zero-copy primitive until the whole file is copied.
+
+    Args:
+        copy_chunk: Function taking (offset, count) and returning the bytes copied
+        copied: Number of bytes already copied
+        size: Size of the source file
+
+    Returns:
+        Number of bytes copied so far, which is less than size if the
+        primitive is not supported for these files
+    """
+    try:
+        while copied < size:
+            # Cap each call at 1 GiB to stay within ssize_t on 32-bit systems
+            sent = copy_chunk(copied, min(size - copied, 1 << 30))
+            if sent == 0:
+                break
+            copied += sent
+    except OSError as e:
+        if e.errno not in ZERO_COPY_FALLBACK_ERRORS:
+            raise
+
+    return copied
+
+
+def positive_int(value: str) -> int:
+    """Argument type accepting only integers greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+
+    return number
+
+
+def default_concurrency(copy: bool) -> int:
+    """Number of worker threads to use when none is given."""
+    if copy:
+        # Copies are dominated by bulk I/O, so more threads keep the disk busy
+        return min(32, (os.cpu_count() or 1) * 4)
+
+    # Moves are cheap renames, a few threads are enough
+    return 8
+
+
+class DirectoryScan:
+    """
+    Recursive scan of a directory tree, listing directories in parallel.
+
+    Each directory is listed as a separate task on a pool of threads, so the
+    listings of a wide or deep tree overlap. The files of each directory are
+    passed back through a queue, in no particular order between directories.
+    Directories that cannot be fully listed are reported on stderr and counted
+    in error_count, and whatever was listed before the error is still used.
+    """
+
+    def __init__(self, directory: str, workers: int = SCAN_WORKERS):
+        """
+        Start scanning a directory.
+
+        Args:
+            directory: Directory to scan
+            workers: Number of threads listing directories
+        """
+        self.error_count = 0
+        self.cancelled = threading.Event()
+        self.found = queue.SimpleQueue()
+        self.pending = 1
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.executor.submit(self.scan, directory)
+
+    def next_batch(self) -> Optional[list]:
+        """
+        Wait for the files of the next directory.
+
+        Returns:
+            List of os.DirEntry for the non-directory entries of a directory
+            that has any, or None once the whole tree has been scanned
+        """
+        files = self.found.get()
+        if files is None:
+            # Keep answering None to any further calls
+            self.found.put(None)
+            self.executor.shutdown(wait=False)
+
+        return files
+
+    def cancel(self) -> None:
+        """
+        Stop the scan from any thread.
+
+        Directories not listed yet are skipped, and a pending or later
+        next_batch call returns None.
+        """
+        self.cancelled.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.found.put(None)
+
+    def scan(self, path: str) -> None:
+        """List one directory, queueing its files and scanning its subdirectories."""
+        try:
+            if self.cancelled.is_set():
+                return
+
+            files = []
+            subdirs = []
+            try:
+                list_directory(path, files, subdirs)
+            except Exception as e:
+                self.report_error(f"Error scanning {path}: {e}")
+
+            if files:
+                self.found.put(files)
+
+            for subdir in subdirs:
+                with self.lock:
+                    self.pending += 1
+                try:
+                    self.executor.submit(self.scan, subdir)
+                except Exception as e:
+                    # Submitting only fails once the scan has been cancelled
+                    if not self.cancelled.is_set():
+                        self.report_error(f"Error scanning {subdir}: {e}")
+                    self.finish()
+        except Exception as e:
+            self.report_error(f"Error scanning {path}: {e}")
+        finally:
+            self.finish()
+
+    def finish(self) -> None:
+        """Mark one directory as done, ending the scan after the last one."""
+        with self.lock:
+            self.pending -= 1
+            finished = self.pending == 0
+
+        if finished:
+            self.found.put(None)
+
+    def report_error(self, message: str) -> None:
+        """Print a scan error and count it."""
+        print(message, file=sys.stderr)
+        with self.lock:
+            self.error_count += 1
+
+
+def list_directory(directory: str, files: list, subdirs: list) -> None:
+    """
+    List the files and subdirectories of a single directory.
+
+    Uses os.scandir so that the file type and stat results are cached on each
+    entry, avoiding a separate stat call per file. Results are added to the
+    given lists as they are read, so they hold the partial listing if an
+    error is raised.
+
+    Args:
+        directory: Directory to list
+        files: List the os.DirEntry of each file is added to
+        subdirs: List the path of each subdirectory is added to
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    if BULK_LISTING:
+        try:
+            bulk_files, bulk_subdirs = list_directory_bulk(directory)
+            files.extend(bulk_files)
+            subdirs.extend(bulk_subdirs)
+            return
+        except Exception:
+            # Not supported by this filesystem, unreadable or not understood,
+            # so list it again with scandir, which raises any real error
+            pass
+
+    # The caller only acts on the listing once it is complete, so files moved
+    # out of the directory do not disturb the scan (as with os.walk)
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                # As os.walk does, treat entries that cannot be followed (e.g. a
+                # symlink loop) as files, so they are reported when processed
+                is_dir = False
+
+            if is_dir:
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+
+                # Like os.walk, do not descend into symlinked directories
+                if not is_symlink:
+                    subdirs.append(entry.path)
+            else:
+                files.append(entry)
+
+
+def list_directory_bulk(directory: str) -> tuple[list, list]:
+    """
+    List the files and subdirectories of a directory with macOS getattrlistbulk.
+
+    Returns the names, types and creation times of many entries per syscall,
+    instead of one getattrlist call per entry as os.scandir and os.stat do.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Tuple of (BulkEntry list of the files, list of subdirectory paths)
+
+    Raises:
+        OSError: If the directory cannot be listed this way
+    """
+    files = []
+    subdirs = []
+
+    attrs = AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_ERROR | ATTR_CMN_OBJTYPE | ATTR_CMN_CRTIME,
+    )
+    buf = ctypes.create_string_buffer(BULK_BUFFER_SIZE)
+
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        while True:
+            count = libc.getattrlistbulk(fd, ctypes.byref(attrs), buf, BULK_BUFFER_SIZE, 0)
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), directory)
+            if count == 0:
+                break
+
+            data = buf.raw
+            offset = 0
+            for _ in range(count):
+                # Each entry is its length, the set of attributes returned and
+                # then the attributes themselves, packed in bit order
+                length, returned = struct.unpack_from('=II16x', data, offset)
+                field = offset + 24
+                offset += length
+
+                if returned & ATTR_CMN_ERROR:
+                    field += 4
+                if not returned & ATTR_CMN_NAME:
+                    continue
+
+                # The name is referenced by an offset from its own field
+                name_offset, name_length = struct.unpack_from('=iI', data, field)
+                name_start = field + name_offset
+                name = os.fsdecode(data[name_start:name_start + name_length - 1])
+                field += 8
+
+                objtype = None
+                if returned & ATTR_CMN_OBJTYPE:
+                    objtype, = struct.unpack_from('=I', data, field)
+                    field += 4
+
+                birthtime = None
+                if returned & ATTR_CMN_CRTIME:
+                    seconds, nanoseconds = struct.unpack_from('=qq', data, field)
+                    birthtime = seconds + nanoseconds / 1e9
+
+                path = os.path.join(directory, name)
+
+                if objtype == VDIR:
+                    subdirs.append(path)
+                elif objtype == VLNK or objtype is None:
+                    # Like os.walk, never descend into linked directories, and
+                    # date other links by what they point to
+                    if not os.path.isdir(path):
+                        files.append(BulkEntry(name, path, None))
+                    elif objtype is None and not os.path.islink(path):
+                        subdirs.append(path)
+                else:
+                    files.append(BulkEntry(name, path, birthtime))
+    finally:
+        os.close(fd)
+
+    return files, subdirs
+
+
+def statx_timestamp(path: str) -> Optional[float]:
     """
-    Get the creation date of a file.
+    Get the creation (or modification) timestamp of a file using Linux statx.
+
+    Requests only the birth and modification times with AT_STATX_DONT_SYNC, so
+    the kernel answers from its cache instead of syncing with the filesystem.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Birth time if the filesystem records it, otherwise modification time,
+        or None if statx is not available on this system
+    """
+    global STATX
+
+    if STATX is None:
+        return None
+
+    buf = Statx()
+    result = STATX(
+        ctypes.c_int(AT_FDCWD),
+        ctypes.c_char_p(os.fsencode(path)),
+        ctypes.c_int(AT_STATX_DONT_SYNC),
+        ctypes.c_uint(STATX_BTIME | STATX_MTIME),
+        ctypes.byref(buf),
+    )
+
+    if result != 0:
+        err = ctypes.get_errno()
+        if err in (errno.ENOSYS, errno.EPERM):
+            # Kernel older than 4.11, or statx blocked by a seccomp filter,
+            # stop trying
+            STATX = None
+            return None
+        raise OSError(err, os.strerror(err), path)
+
+    if buf.stx_mask & STATX_BTIME:
+        timestamp = buf.stx_btime
+    else:
+        timestamp = buf.stx_mtime
+
+    return timestamp.tv_sec + timestamp.tv_nsec / 1e9
+
+
+def file_creation_year(entry: Union[os.DirEntry, BulkEntry]) -> int:
+    """
+    Get the creation year of a file.
     
     Args:
-        file_path: Path to the file
+        entry: Directory entry of the file
         
     Returns:
-        datetime object representing the file creation date
+        Year the file was created in, in local time
     """
     try:
-        # Get file stats
-        stat_info = os.stat(file_path)
-        
-        # On Windows, use st_ctime (creation time)
-        # On Unix, st_ctime is the last metadata change time, so we use st_birthtime if available
-        # Otherwise fall back to st_mtime (modification time)
-        if hasattr(stat_info, 'st_birthtime'):
-            # macOS and some BSD systems
-            timestamp = stat_info.st_birthtime
-        elif sys.platform == 'win32':
-            # Windows
-            timestamp = stat_info.st_ctime
-        else:
-            # Linux and others - use modification time as fallback
-            timestamp = stat_info.st_mtime
+        # On macOS, the creation time may already have come with the listing
+        timestamp = getattr(entry, 'birthtime', None)
+
+        if timestamp is None:
+            # On Linux, statx gives the birth time where the filesystem records it
+            timestamp = statx_timestamp(entry.path)
+
+        if timestamp is None:
+            # Get file stats (cached on the entry after the first call)
+            stat_info = entry.stat()
             
-        return datetime.fromtimestamp(timestamp)
+            # On Windows, use st_ctime (creation time)
+            # On Unix, st_ctime is the last metadata change time, so we use st_birthtime if available
+            # Otherwise fall back to st_mtime (modification time)
+            if hasattr(stat_info, 'st_birthtime'):
+                # macOS and some BSD systems
+                timestamp = stat_info.st_birthtime
+            elif sys.platform == 'win32':
+                # Windows
+                timestamp = stat_info.st_ctime
+            else:
+                # Linux and others - use modification time as fallback
+                timestamp = stat_info.st_mtime
+
+        return timestamp_year(timestamp)
     except Exception as e:
-        print(f"Error getting creation date for {file_path}: {e}", file=sys.stderr)
+        print(f"Error getting creation date for {entry.path}: {e}", file=sys.stderr)
         raise
 
 
-def print_message(file_path: Path, new_file_path: Path, copy: bool, full_path: bool, source_path: Path, dry_run: bool) -> None:
-    """Prints the move or copy message."""
+def timestamp_year(timestamp: float) -> int:
+    """
+    Get the local-time year of a timestamp.
+
+    Args:
+        timestamp: Seconds since the epoch
+
+    Returns:
+        Year the timestamp falls in
+    """
+    index = bisect.bisect_right(YEAR_STARTS, timestamp)
+    if 0 < index < len(YEAR_STARTS):
+        return FIRST_YEAR + index - 1
+
+    # Outside the precomputed years
+    return time.localtime(timestamp).tm_year
+
+
+def flush_output(output: list) -> None:
+    """Writes out and clears the buffered output lines."""
+    if output:
+        sys.stdout.write(''.join(output))
+        output.clear()
+
+
+def message_action(copy: bool, dry_run: bool) -> str:
+    """Returns the action shown at the start of each message."""
     action = "Copying" if copy else "Moving"
 
     if dry_run:
         action = f"[Dry Run] {action}"
 
+    return action
+
+
+def format_message(file_path: str, new_file_path: str, relative_path: str, year: str, action: str, full_path: bool) -> str:
+    """Formats the move or copy message as an output line."""
     if full_path:
-        print(f"{action}: {file_path} -> {new_file_path}")
+        return f"{action}: {file_path} -> {new_file_path}\n"
     else:
-        print(f"{action}: {file_path.relative_to(source_path.parent)} -> {new_file_path.relative_to(source_path.parent)}")
+        # Both paths relative to the parent of the source directory
+        return f"{action}: {relative_path} -> {year}{os.sep}{relative_path}\n"
 
 if __name__ == '__main__':
     """Main entry point for the script."""
@@ -134,9 +929,10 @@ Examples:
     parser.add_argument('--copy', action='store_true', help='Copy instead of move files')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without actually moving files')
     parser.add_argument('--full-path', action='store_true', help='Show full paths in the output instead of relatives')
+    parser.add_argument('--concurrency', type=positive_int, help='Number of files to move or copy in parallel (default: 8 for moves, 4 per CPU up to 32 for copies)')
     args = parser.parse_args()
     
-    moved_count, error_count = move_files(args.directory, args.copy, args.dry_run, args.full_path)
+    moved_count, error_count = move_files(args.directory, args.copy, args.dry_run, args.full_path, args.concurrency)
 
     print(f"\nJob completed!")
     print(f"Files processed: {moved_count}")